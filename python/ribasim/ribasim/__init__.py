@@ -2,8 +2,36 @@ __version__ = "2025.1.0"
 # Keep synced write_schema_version in ribasim_qgis/core/geopackage.py
 __schema_version__ = 4
 
-from ribasim.config import Allocation, Logging, Node, Solver
-from ribasim.geometry.link import LinkTable
-from ribasim.model import Model
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ribasim.config import Allocation, Logging, Node, Solver
+    from ribasim.geometry.link import LinkTable
+    from ribasim.model import Model
 
 __all__ = ["LinkTable", "Allocation", "Logging", "Model", "Solver", "Node"]
+
+# The public classes are imported on first access (PEP 562),
+# such that `import ribasim` does not pull in pandas, geopandas and pydantic.
+_lazy_imports = {
+    "Allocation": "ribasim.config",
+    "Logging": "ribasim.config",
+    "Node": "ribasim.config",
+    "Solver": "ribasim.config",
+    "LinkTable": "ribasim.geometry.link",
+    "Model": "ribasim.model",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
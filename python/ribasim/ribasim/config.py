@@ -1,7 +1,7 @@
 import numbers
 from collections.abc import Sequence
 from enum import Enum
-from typing import Any
+from typing import Any, cast
 
 import numpy as np
 import pandas as pd
@@ -241,6 +241,12 @@ class MultiNodeModel(NodeModel):
         self.node.filter(self.__class__.__name__)
         return self
 
+    @classmethod
+    def _construct_trusted(cls, config: dict[str, Any]) -> "MultiNodeModel":
+        node_model = cast(MultiNodeModel, super()._construct_trusted(config))
+        node_model.filter()  # type: ignore[operator]
+        return node_model
+
     def add(
         self, node: Node, tables: Sequence[TableModel[Any]] | None = None
     ) -> NodeData:
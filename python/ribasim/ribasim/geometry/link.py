@@ -1,12 +1,10 @@
 from pathlib import Path
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import pandera as pa
 import shapely
-from matplotlib.axes import Axes
 from numpy.typing import NDArray
 from pandera.dtypes import Int32
 from pandera.typing import Index, Series
@@ -26,6 +24,9 @@ from ribasim.validation import (
 
 from .base import _GeoBaseSchema
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
 __all__ = ("LinkTable",)
 
 SPATIALCONTROLNODETYPES = {
@@ -185,7 +186,7 @@ class LinkTable(SpatialTableModel[LinkSchema]):
         assert self.df is not None
         return (self.df.link_type == link_type).to_numpy()
 
-    def plot(self, **kwargs) -> Axes:
+    def plot(self, **kwargs) -> "Axes":
         """Plot the links of the model.
 
         Parameters
@@ -193,6 +194,8 @@ class LinkTable(SpatialTableModel[LinkSchema]):
         **kwargs : Dict
             Supported: 'ax', 'color_flow', 'color_control'
         """
+        import matplotlib.pyplot as plt
+
         assert self.df is not None
         kwargs = kwargs.copy()  # Avoid side-effects
         ax = kwargs.get("ax", None)
@@ -1,11 +1,9 @@
 from typing import Any
 
 import geopandas as gpd
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import pandera as pa
-from matplotlib.patches import Patch
 from pandera.dtypes import Int32
 from pandera.typing import Index, Series
 from pandera.typing.geopandas import GeoSeries
@@ -45,6 +43,9 @@ class NodeTable(SpatialTableModel[NodeSchema]):
             self.df.drop(mask, inplace=True)
 
     def plot_allocation_networks(self, ax=None, zorder=None) -> Any:
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import Patch
+
         if ax is None:
             _, ax = plt.subplots()
             ax.axis("off")
@@ -97,6 +98,8 @@ class NodeTable(SpatialTableModel[NodeSchema]):
         -------
         None
         """
+        import matplotlib.pyplot as plt
+
         if ax is None:
             _, ax = plt.subplots()
             ax.axis("off")
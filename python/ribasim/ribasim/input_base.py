@@ -221,6 +221,25 @@ class TableModel(FileModel, Generic[TableT]):
 
         return value
 
+    @classmethod
+    def _construct_trusted(
+        cls, filepath: Path | None, sort_keys: list[str]
+    ) -> "TableModel[TableT]":
+        """Construct the table from trusted input without running validation.
+
+        The data is only coerced to the dtypes of the schema.
+        """
+        data = cls._load(filepath)
+        df = data.get("df")
+        if df is not None:
+            T = cls.tableschema()
+            df = T.to_schema().coerce_dtype(df)
+            df.index.name = T._index_name()
+        fields = {"df": df} if filepath is None else {"df": df, "filepath": filepath}
+        table = cls.model_construct(**fields)
+        table._sort_keys = sort_keys
+        return table
+
     def _node_ids(self) -> set[int]:
         node_ids: set[int] = set()
         if self.df is not None and "node_id" in self.df.columns:
@@ -278,7 +297,11 @@ class TableModel(FileModel, Generic[TableT]):
         """Write the contents of the input to a an arrow file."""
         assert self.df is not None
         path = directory / input_dir / filepath
-        path.parent.mkdir(parents=True, exist_ok=True)
+        # Skip the directories that were already created during this write
+        created_dirs: set[Path] = context_file_writing.get().get("created_dirs", set())
+        if path.parent not in created_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(path.parent)
         self.df.to_feather(
             path,
             compression="zstd",
@@ -429,7 +452,7 @@ class NodeModel(ChildModel):
         self, serializer: Callable[[type["NodeModel"]], dict[str, Any]]
     ) -> dict[str, Any]:
         content = serializer(self)
-        return dict(filter(lambda x: x[1], content.items()))
+        return {k: v for k, v in content.items() if v}
 
     @field_validator("*")
     @classmethod
@@ -444,6 +467,20 @@ class NodeModel(ChildModel):
                 v._sort_keys = cast(list[str], extra.get("sort_keys", []))
         return v
 
+    @classmethod
+    def _construct_trusted(cls, config: dict[str, Any]) -> "NodeModel":
+        """Construct the node model and its tables from trusted input without running validation."""
+        tables = {}
+        for key, field in cls.model_fields.items():
+            extra = field.json_schema_extra
+            sort_keys = extra.get("sort_keys", []) if isinstance(extra, dict) else []
+            filepath = config.get(key)
+            tables[key] = field.annotation._construct_trusted(  # type: ignore
+                None if filepath is None else Path(filepath),
+                cast(list[str], sort_keys),
+            )
+        return cls.model_construct(_fields_set=set(config), **tables)
+
     @classmethod
     def get_input_type(cls):
         return cls.__name__
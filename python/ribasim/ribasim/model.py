@@ -1,18 +1,23 @@
+import copy
 import datetime
+import hashlib
 import logging
 import shutil
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import numpy as np
 import pandas as pd
 import tomli
 import tomli_w
-from matplotlib import pyplot as plt
 from pandera.typing.geopandas import GeoDataFrame
 from pydantic import (
+    BaseModel,
     DirectoryPath,
     Field,
     PrivateAttr,
@@ -44,13 +49,14 @@ from ribasim.config import (
     Terminal,
     UserDemand,
 )
-from ribasim.db_utils import _set_db_schema_version
+from ribasim.db_utils import _get_db_schema_version, _set_db_schema_version
 from ribasim.geometry.link import LinkSchema, LinkTable
 from ribasim.geometry.node import NodeTable
 from ribasim.input_base import (
     ChildModel,
     FileModel,
     SpatialTableModel,
+    TableModel,
     context_file_loading,
     context_file_writing,
 )
@@ -58,6 +64,7 @@ from ribasim.utils import (
     MissingOptionalModule,
     UsedIDs,
     _concat,
+    _hash_dataframe,
     _link_lookup,
     _node_lookup,
     _node_lookup_numpy,
@@ -111,26 +118,29 @@ class Model(FileModel):
     use_validation: bool = Field(default=True, exclude=True)
 
     _used_node_ids: UsedIDs = PrivateAttr(default_factory=UsedIDs)
+    _children_cache: dict[str, ChildModel] | None = PrivateAttr(default=None)
+    # The GeoPackage file and tables of the last write, see `_database_record`
+    _written_database: tuple[Any, ...] | None = PrivateAttr(default=None)
+
+    # Names of the MultiNodeModel and ChildModel fields, filled in after class creation
+    _NODE_FIELDS: ClassVar[tuple[str, ...]] = ()
+    _CHILD_FIELDS: ClassVar[tuple[str, ...]] = ()
 
     @model_validator(mode="after")
-    def _set_node_parent(self) -> "Model":
-        for (
-            k,
-            v,
-        ) in self._children().items():
-            setattr(v, "_parent", self)
-            setattr(v, "_parent_field", k)
+    def _after_validation(self) -> "Model":
+        # A single after validator, since each one adds a validation pass
+        self._ensure_link_table_is_present()
+        self._update_used_ids()
+        # Drop database info
+        context_file_loading.set({})
         return self
 
-    @model_validator(mode="after")
-    def _ensure_link_table_is_present(self) -> "Model":
+    def _ensure_link_table_is_present(self) -> None:
         if self.link.df is None:
             self.link.df = GeoDataFrame[LinkSchema](index=pd.Index([], name="link_id"))
         self.link.df = self.link.df.set_geometry("geometry", crs=self.crs)
-        return self
 
-    @model_validator(mode="after")
-    def _update_used_ids(self) -> "Model":
+    def _update_used_ids(self) -> None:
         # Only update the used node IDs if we read from a database
         if "database" in context_file_loading.get():
             df = self.node_table().df
@@ -138,7 +148,6 @@ class Model(FileModel):
             if len(df.index) > 0:
                 self._used_node_ids.node_ids.update(df.index)
                 self._used_node_ids.max_node_id = df.index.max()
-        return self
 
     @field_serializer("input_dir", "results_dir")
     def _serialize_path(self, path: Path) -> str:
@@ -151,6 +160,32 @@ class Model(FileModel):
         # and enforce that they are always written.
         self.model_fields_set.update({"input_dir", "results_dir"})
         self.edge = self.link  # Backwards compatible alias for link
+        for k, v in self._children().items():
+            self._set_parent(k, v)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._CHILD_FIELDS:
+            # Clear before assignment, such that validators do not see the old child
+            self._children_cache = None
+        super().__setattr__(name, value)
+        if name in self._CHILD_FIELDS:
+            # `model_post_init` only runs on construction, so also wire assigned children
+            self._set_parent(name, getattr(self, name))
+
+    def _set_parent(self, field: str, child: ChildModel) -> None:
+        # Private attributes need no validation, so set them directly
+        assert child.__pydantic_private__ is not None
+        child.__pydantic_private__.update(_parent=self, _parent_field=field)
+
+    def __copy__(self) -> "Model":
+        copied = super().__copy__()
+        copied._children_cache = None
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "Model":
+        copied = super().__deepcopy__(memo)
+        copied._children_cache = None
+        return copied
 
     def __repr__(self) -> str:
         """Generate a succinct overview of the Model content.
@@ -186,38 +221,89 @@ class Model(FileModel):
         Path
             The file path of the written TOML file.
         """
-        content = self.model_dump(exclude_unset=True, exclude_none=True, by_alias=True)
-        # Filter empty dicts (default Nodes)
-        content = dict(filter(lambda x: x[1], content.items()))
+        content = self._dump_set_fields()
         content["ribasim_version"] = ribasim.__version__
-        with open(fn, "wb") as f:
-            tomli_w.dump(content, f)
+        # Serialize in memory and write at once, instead of the many small writes of `tomli_w.dump`
+        fn.write_bytes(tomli_w.dumps(content).encode())
         return fn
 
+    def _dump_set_fields(self) -> dict[str, Any]:
+        """Dump the fields that are set, like `model_dump(exclude_unset=True, exclude_none=True)`.
+
+        Only the set fields are looked up and dumped,
+        the unused (default) node types are skipped entirely.
+        Empty values, like the empty dicts of default Nodes, are left out.
+        """
+        fields_set = self.model_fields_set
+        keys = [
+            k
+            for k, field in self.model_fields.items()
+            if k in fields_set and not field.exclude
+        ]
+        keys += [k for k in self.model_extra or {} if k in fields_set]
+
+        content: dict[str, Any] = {}
+        for key in keys:
+            value = getattr(self, key)
+            if isinstance(value, BaseModel):
+                value = value.model_dump(
+                    exclude_unset=True, exclude_none=True, by_alias=True
+                )
+            elif isinstance(value, Path):
+                value = self._serialize_path(value)
+            if value:
+                content[key] = value
+        return content
+
     def _save(self, directory: DirectoryPath, input_dir: DirectoryPath):
         # We write all tables to a temporary GeoPackage with a dot prefix,
         # and at the end move this over the target file.
         # This does not throw a PermissionError if the file is open in QGIS.
         db_path = directory / input_dir / ".database.gpkg"
-
-        # avoid adding tables to existing model
+        target_path = db_path.with_name("database.gpkg")
         db_path.parent.mkdir(parents=True, exist_ok=True)
-        db_path.unlink(missing_ok=True)
         context_file_writing.get()["database"] = db_path
+        context_file_writing.get()["created_dirs"] = {db_path.parent}
 
-        self.link._save(directory, input_dir)
         node = self.node_table()
-
         assert node.df is not None
-        node._save(directory, input_dir)
-
-        # Run after geopackage schema has been created
-        _set_db_schema_version(db_path, ribasim.__schema_version__)
-
-        for sub in self._nodes():
-            sub._save(directory, input_dir)
+        tables = [table for sub in self._nodes() for table in sub._tables()]
+        arrow_tables = [table for table in tables if table.filepath is not None]
+        db_tables: list[TableModel[Any]] = [self.link, node]
+        db_tables += [table for table in tables if table.filepath is None]
+
+        # Sort before hashing, such that the digest matches the written tables
+        for table in db_tables:
+            table.sort()
+        digest = _tables_digest(db_tables)
+        # Skip the GeoPackage if it is untouched since we last wrote these tables to it
+        db_unchanged = self._written_database is not None and (
+            _database_record(target_path, digest) == self._written_database
+        )
 
-        shutil.move(db_path, db_path.with_name("database.gpkg"))
+        # Tables with a filepath are written to separate Arrow files, in parallel.
+        # The GeoPackage tables are written sequentially, since SQLite allows a single writer.
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(arrow_tables)))) as pool:
+            futures = [
+                pool.submit(copy_context().run, table._save, directory, input_dir)
+                for table in arrow_tables
+            ]
+            if not db_unchanged:
+                # avoid adding tables to existing model
+                db_path.unlink(missing_ok=True)
+                # The tables are sorted already, so write them without `_save`
+                self.link._write_geopackage(db_path)
+                node._write_geopackage(db_path)
+                # Run after geopackage schema has been created
+                _set_db_schema_version(db_path, ribasim.__schema_version__)
+                for table in db_tables[2:]:
+                    table._write_geopackage(db_path)
+            for future in futures:
+                future.result()
+
+        if not db_unchanged:
+            shutil.move(db_path, target_path)
+            self._written_database = _database_record(target_path, digest)
 
     def set_crs(self, crs: str) -> None:
         """Set the coordinate reference system of the data in the model.
@@ -261,36 +347,67 @@ class Model(FileModel):
 
     def _nodes(self) -> Generator[MultiNodeModel, Any, None]:
         """Return all non-empty MultiNodeModel instances."""
-        for key in self.model_fields.keys():
+        for key in type(self)._NODE_FIELDS:
             attr = getattr(self, key)
-            if (
-                isinstance(attr, MultiNodeModel)
-                and attr.node.df is not None
-                # TODO: Model.read creates empty node tables (#1278)
-                and not attr.node.df.empty
-            ):
+            df = attr.node.df
+            # TODO: Model.read creates empty node tables (#1278)
+            if df is not None and not df.empty:
                 yield attr
 
-    def _children(self):
-        return {
-            k: getattr(self, k)
-            for k in self.model_fields.keys()
-            if isinstance(getattr(self, k), ChildModel)
-        }
+    def _children(self) -> dict[str, ChildModel]:
+        # Cached until one of the child fields is assigned, see `__setattr__`
+        if self._children_cache is None:
+            self._children_cache = {
+                k: getattr(self, k) for k in type(self)._CHILD_FIELDS
+            }
+        return self._children_cache
 
     @classmethod
-    def read(cls, filepath: str | PathLike[str]) -> "Model":
+    def read(cls, filepath: str | PathLike[str], *, trusted: bool = False) -> "Model":
         """Read a model from a TOML file.
 
         Parameters
         ----------
         filepath : str | PathLike[str]
             The path to the TOML file.
+        trusted : bool
+            Skip validation of the model and its tables, only coercing the table dtypes.
+            Only use this for models written by Ribasim itself, never for user supplied input.
+            (Optional, defaults to False)
         """
         if not Path(filepath).is_file():
             raise FileNotFoundError(f"File '{filepath}' does not exist.")
+        if trusted:
+            return cls._read_trusted(Path(filepath))
         return cls(filepath=filepath)  # type: ignore
 
+    @classmethod
+    def _read_trusted(cls, filepath: Path) -> "Model":
+        config = cls._load(filepath)
+        db_path = context_file_loading.get()["database"]
+        if _get_db_schema_version(db_path) < ribasim.__schema_version__:
+            # Outdated databases are migrated during validation
+            return cls(filepath=filepath)  # type: ignore
+
+        fields = dict(config)
+        for key in ("input_dir", "results_dir"):
+            if key in fields:
+                fields[key] = Path(fields[key])
+        for key in cls._CHILD_FIELDS:
+            annotation = cls.model_fields[key].annotation
+            if key in cls._NODE_FIELDS:
+                fields[key] = annotation._construct_trusted(config.get(key, {}))  # type: ignore
+            else:
+                fields[key] = annotation(**config.get(key, {}))  # type: ignore
+        fields["link"] = LinkTable._construct_trusted(None, [])
+        fields["filepath"] = filepath
+
+        model = cls.model_construct(_fields_set=set(config) | {"filepath"}, **fields)
+        # model_construct skips validation, so run the after validators explicitly
+        model.link._update_used_ids()  # type: ignore[operator]
+        model._after_validation()  # type: ignore[operator]
+        return model
+
     def write(self, filepath: str | PathLike[str]) -> Path:
         """Write the contents of the model to disk and save it as a TOML configuration file.
 
@@ -301,13 +418,15 @@ class Model(FileModel):
         filepath : str | PathLike[str]
             A file path with .toml extension.
         """
+        filepath = Path(filepath)
+        if filepath.suffix != ".toml":
+            raise ValueError(f"Filepath '{filepath}' is not a .toml file.")
+
         if self.use_validation:
             self._validate_model()
 
-        filepath = Path(filepath)
-        self.filepath = filepath
-        if not filepath.suffix == ".toml":
-            raise ValueError(f"Filepath '{filepath}' is not a .toml file.")
+        # Avoid assignment validation, which would read an existing TOML again
+        self.set_filepath(filepath)
         context_file_writing.set({})
         directory = filepath.parent
         directory.mkdir(parents=True, exist_ok=True)
@@ -437,8 +556,7 @@ class Model(FileModel):
         context_file_loading.set({})
 
         if filepath is not None and filepath.is_file():
-            with open(filepath, "rb") as f:
-                config = tomli.load(f)
+            config = _read_toml(filepath)
 
             directory = filepath.parent / config.get("input_dir", ".")
             context_file_loading.get()["directory"] = directory
@@ -453,12 +571,6 @@ class Model(FileModel):
         else:
             return {}
 
-    @model_validator(mode="after")
-    def _reset_contextvar(self) -> "Model":
-        # Drop database info
-        context_file_loading.set({})
-        return self
-
     def plot_control_listen(self, ax):
         """Plot the implicit listen links of the model."""
         df_listen_link = pd.DataFrame(
@@ -544,10 +656,16 @@ class Model(FileModel):
         ax : matplotlib.pyplot.Artist
             Axis on which the plot is drawn.
         """
+        from matplotlib import pyplot as plt
+
         if ax is None:
             _, ax = plt.subplots()
             ax.axis("off")
 
+        # Without nodes there is nothing to draw
+        if next(self._nodes(), None) is None:
+            return ax
+
         node = self.node_table()
         self.link.plot(ax=ax, zorder=2)
         self.plot_control_listen(ax)
@@ -736,3 +854,67 @@ class Model(FileModel):
             uds[varname] = da
 
         return uds
+
+
+def _tables_digest(tables: list[TableModel[Any]]) -> bytes:
+    """Hash the names and content of the tables written to a GeoPackage."""
+    digest = hashlib.blake2b(digest_size=16)
+    for table in tables:
+        digest.update(table.tablename().encode())
+        if table.df is not None:
+            digest.update(_hash_dataframe(table.df))
+    return digest.digest()
+
+
+def _database_record(db_path: Path, tables_digest: bytes) -> tuple[Any, ...] | None:
+    """Identify a GeoPackage file on disk together with the tables written to it.
+
+    The inode, modification time, size and SQLite change counter of the file
+    catch changes made by others, the tables digest catches changes to the model.
+    This is a cheap check rather than a content hash: a change that leaves all of these
+    the same, like a write in WAL mode within one timestamp tick, goes unnoticed.
+    """
+    if not db_path.is_file():
+        return None
+    stat = db_path.stat()
+    with open(db_path, "rb") as f:
+        # The file change counter, at offset 24 of the SQLite header
+        f.seek(24)
+        change_counter = f.read(4)
+    return (
+        db_path.resolve(),
+        stat.st_ino,
+        stat.st_mtime_ns,
+        stat.st_size,
+        change_counter,
+        tables_digest,
+    )
+
+
+@lru_cache(maxsize=32)
+def _parse_toml(data: bytes) -> dict[str, Any]:
+    return tomli.loads(data.decode())
+
+
+def _read_toml(filepath: Path) -> dict[str, Any]:
+    """Read a TOML file, reusing the parsed content if the file is unchanged.
+
+    The cache is keyed on the file content, since reading it is cheap compared to parsing,
+    and file timestamps are too coarse to detect quick rewrites.
+    A copy is returned, since the callers update the content.
+    """
+    config = _parse_toml(filepath.read_bytes())
+    return copy.deepcopy(config)
+
+
+def _fields_of_type(model: type[Model], base: type) -> tuple[str, ...]:
+    """Return the names of the fields of `model` annotated with a subclass of `base`."""
+    return tuple(
+        k
+        for k, f in model.model_fields.items()
+        if isinstance(f.annotation, type) and issubclass(f.annotation, base)
+    )
+
+
+Model._NODE_FIELDS = _fields_of_type(Model, MultiNodeModel)
+Model._CHILD_FIELDS = _fields_of_type(Model, ChildModel)
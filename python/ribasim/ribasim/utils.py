@@ -1,3 +1,4 @@
+import hashlib
 import re
 from warnings import catch_warnings, filterwarnings
 
@@ -86,6 +87,16 @@ def _concat(dfs, **kwargs):
         return pd.concat(dfs, **kwargs)
 
 
+def _hash_dataframe(df: pd.DataFrame) -> bytes:
+    """Hash the content, index, column names, dtypes and CRS of a DataFrame."""
+    digest = hashlib.blake2b(digest_size=16)
+    crs = getattr(df, "crs", None)
+    header = (df.index.name, list(df.columns), [str(t) for t in df.dtypes], str(crs))
+    digest.update(repr(header).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.digest()
+
+
 class UsedIDs(BaseModel):
     """A helper class to manage globally unique node IDs.
 
@@ -10,6 +10,7 @@ from pandas import DataFrame
 from pandas.testing import assert_frame_equal
 from pydantic import ValidationError
 from ribasim import Model, Node, Solver
+from ribasim.model import _read_toml
 from ribasim.nodes import basin, flow_boundary, flow_demand, pump, user_demand
 from ribasim.utils import UsedIDs
 from shapely.geometry import Point
@@ -55,6 +56,13 @@ def test_basic_arrow(basic_arrow, tmp_path):
     __assert_equal(model_orig.basin.profile.df, model_loaded.basin.profile.df)
 
 
+def test_arrow_subdirectory(basic_arrow, tmp_path):
+    basic_arrow.basin.static.set_filepath(Path("tables/basin_static.arrow"))
+    basic_arrow.write(tmp_path / "ribasim.toml")
+    assert (tmp_path / "input/tables/basin_static.arrow").is_file()
+    assert (tmp_path / "input/profile.arrow").is_file()
+
+
 def test_basic_transient(basic_transient, tmp_path):
     model_orig = basic_transient
     model_orig.write(tmp_path / "basic_transient/ribasim.toml")
@@ -312,6 +320,64 @@ def test_roundtrip(trivial, tmp_path):
             __assert_equal(table1.df, table2.df)
 
 
+def test_read_trusted(basic_arrow, tmp_path):
+    toml_path = tmp_path / "basic_arrow/ribasim.toml"
+    basic_arrow.write(toml_path)
+    model = Model.read(toml_path)
+    model_trusted = Model.read(toml_path, trusted=True)
+
+    assert model_trusted.filepath == toml_path
+    assert model_trusted.basin._parent is model_trusted
+    assert model_trusted._used_node_ids.node_ids == model._used_node_ids.node_ids
+    assert model_trusted.model_dump() == model.model_dump()
+    assert_frame_equal(model_trusted.node_table().df, model.node_table().df)
+    assert_frame_equal(model_trusted.link.df, model.link.df)
+    for node1, node2 in zip(model._nodes(), model_trusted._nodes()):
+        for table1, table2 in zip(node1._tables(), node2._tables()):
+            assert_frame_equal(table1.df, table2.df)
+
+
+def test_read_toml_cache(basic, tmp_path):
+    toml_path = tmp_path / "ribasim.toml"
+    basic.write(toml_path)
+    config = _read_toml(toml_path)
+    config["solver"] = {"saveat": 0.0}
+    assert _read_toml(toml_path) != config
+
+    text = toml_path.read_text()
+    toml_path.write_text(text + "\n[solver]\nsaveat = 3600.0\n")
+    assert Model.read(toml_path).solver.saveat == 3600.0
+
+    # A rewrite of the same size, within the resolution of the file timestamps
+    toml_path.write_text(text + "\n[solver]\nsaveat = 7200.0\n")
+    assert Model.read(toml_path).solver.saveat == 7200.0
+
+
+def test_write_unchanged_database(basic, tmp_path):
+    toml_path = tmp_path / "ribasim.toml"
+    db_path = tmp_path / "database.gpkg"
+    basic.write(toml_path)
+    mtime = db_path.stat().st_mtime_ns
+
+    # Nothing changed, so the GeoPackage is left alone
+    basic.write(toml_path)
+    assert db_path.stat().st_mtime_ns == mtime
+
+    basic.basin.static.df.loc[0, "potential_evaporation"] = 0.5
+    basic.write(toml_path)
+    assert db_path.stat().st_mtime_ns != mtime
+    model = Model.read(toml_path)
+    assert model.basin.static.df["potential_evaporation"].iloc[0] == 0.5
+
+    # Another model writing the same path is noticed, even with equal size and mtime
+    other = Model.read(toml_path)
+    other.basin.static.df.loc[0, "potential_evaporation"] = 0.25
+    other.write(toml_path)
+    basic.write(toml_path)
+    model = Model.read(toml_path)
+    assert model.basin.static.df["potential_evaporation"].iloc[0] == 0.5
+
+
 def test_datetime_timezone():
     # Due to a pydantic issue, a time zone was added.
     # https://github.com/Deltares/Ribasim/issues/1282
@@ -1,4 +1,6 @@
 import re
+import subprocess
+import sys
 from sqlite3 import connect
 
 import numpy as np
@@ -9,10 +11,11 @@ import xugrid
 from pydantic import ValidationError
 from pyproj import CRS
 from ribasim import Node
-from ribasim.config import Solver
+from ribasim.config import Logging, Solver, Terminal
 from ribasim.geometry.link import NodeData
 from ribasim.input_base import esc_id
 from ribasim.model import Model
+from ribasim.utils import _concat
 from ribasim_testmodels import (
     basic_model,
     outlet_model,
@@ -27,6 +30,15 @@ def test_repr(basic):
     assert representation[0] == "ribasim.Model("
 
 
+def test_repr_skips_table_content(basic):
+    # Node types only list their non-empty tables, such that the repr
+    # stays a single line per field regardless of the table sizes.
+    representation = repr(basic).split("\n")
+    assert "    link=Link(...)," in representation
+    n_unused = len(basic._NODE_FIELDS) - len(list(basic._nodes()))
+    assert len(representation) == len(basic._fields()) - n_unused + 2
+
+
 def test_solver():
     solver = Solver()
     assert solver.algorithm == "QNDF"  # default
@@ -65,6 +77,30 @@ def test_parent_relationship(basic):
     assert model.pump._parent_field == "pump"
 
 
+def test_parent_relationship_assigned(basic):
+    model = basic
+    model.terminal = Terminal()
+    assert model.terminal._parent is model
+    model.terminal.add(Node(100, Point(0, 0)))
+    assert 100 in model.node_table().df.index
+
+    model.logging = Logging()
+    model.model_fields_set.discard("logging")
+    model.logging.verbosity = "debug"
+    assert "logging" in model.model_fields_set
+
+
+def test_children_cache(basic):
+    model = basic
+    children = model._children()
+    assert model._children() is children
+    model.solver = Solver(saveat=3600.0)
+    assert model._children()["solver"] is model.solver
+    assert model.solver._parent is model
+    copied = model.model_copy(deep=True)
+    assert copied._children()["basin"] is copied.basin
+
+
 def test_exclude_unset(basic):
     model = basic
     model.solver.saveat = 86400.0
@@ -73,6 +109,15 @@ def test_exclude_unset(basic):
     assert d["solver"]["saveat"] == 86400.0
 
 
+def test_dump_set_fields(basic):
+    model = basic
+    model.solver.saveat = 3600.0
+    d = model.model_dump(exclude_unset=True, exclude_none=True, by_alias=True)
+    expected = {k: v for k, v in d.items() if v}
+    assert model._dump_set_fields() == expected
+    assert "pid_control" not in model._dump_set_fields()
+
+
 def test_invalid_node_id():
     with pytest.raises(
         ValueError,
@@ -101,6 +146,22 @@ def test_plot(discrete_control_of_pid_control):
     discrete_control_of_pid_control.plot()
 
 
+def test_plot_empty_model():
+    model = Model(starttime="2020-01-01", endtime="2021-01-01", crs="EPSG:28992")
+    ax = model.plot()
+    assert not ax.has_data()
+
+
+def test_write_requires_toml(basic, tmp_path):
+    with pytest.raises(ValueError, match="is not a .toml file"):
+        basic.write(tmp_path / "ribasim.txt")
+    assert basic.filepath is None
+    basic.write(tmp_path / "ribasim.toml")
+    # writing over an existing model keeps working
+    basic.write(tmp_path / "ribasim.toml")
+    assert basic.filepath == tmp_path / "ribasim.toml"
+
+
 def test_write_adds_fid_in_tables(basic, tmp_path):
     model_orig = basic
     # for node an explicit index was provided
@@ -245,3 +306,32 @@ def test_non_existent_files(tmp_path):
 
     with pytest.raises(FileNotFoundError, match=r"Database file .* does not exist\."):
         Model.read(toml_path)
+
+
+def test_cached_field_names(basic):
+    assert "basin" in Model._NODE_FIELDS
+    assert "link" not in Model._NODE_FIELDS
+    assert set(Model._NODE_FIELDS) < set(Model._CHILD_FIELDS)
+    assert "solver" in basic._children()
+    assert all(node.node.df is not None for node in basic._nodes())
+
+
+def test_node_table_matches_concat(basic):
+    expected = _concat([node.node.df for node in basic._nodes()]).sort_index()
+    pd.testing.assert_frame_equal(basic.node_table().df, expected)
+
+
+def test_lazy_imports():
+    code = (
+        "import sys, ribasim; assert 'pandas' not in sys.modules; "
+        "ribasim.Model; assert 'matplotlib.pyplot' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_schemas_built_on_import():
+    # The Pydantic schemas are complete on import of ribasim.model,
+    # such that the first validation does not pay for building them.
+    assert Model.__pydantic_complete__
+    for key in Model._CHILD_FIELDS:
+        assert Model.model_fields[key].annotation.__pydantic_complete__